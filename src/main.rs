@@ -41,7 +41,8 @@ fn main() -> Result<()> {
     let mut fsm = FSM::new(&mut session);
 
     loop {
-        let line = readline()?;
+        // treat end of input as quit, so scripted sessions don't spin on closed stdin
+        let line = readline()?.unwrap_or_else(|| String::from("q"));
         let line = line.trim();
         if line.is_empty() {
             continue;
@@ -64,10 +65,12 @@ fn main() -> Result<()> {
     }
 }
 
-fn readline() -> Result<String> {
+fn readline() -> Result<Option<String>> {
     print!("> ");
     std::io::stdout().flush()?;
     let mut buf = String::new();
-    std::io::stdin().read_line(&mut buf)?;
-    Ok(buf)
+    if std::io::stdin().read_line(&mut buf)? == 0 {
+        return Ok(None);
+    }
+    Ok(Some(buf))
 }
@@ -1,8 +1,2 @@
-from dataclasses import dataclass
-
-
-@dataclass(frozen=True)
-class Step:
-    command: str
-    expected_output: str | list[str] = ""
-    not_expected_output: str = ""
+from tests.flags import GCC_FLAGS, MINIMAL_GCC_FLAGS
+from tests.step import Step
@@ -1,65 +1,188 @@
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 import subprocess
-import string
-import random
+import fcntl
+import hashlib
+import inspect
+import ast
+import tempfile
+import shutil
 import os
 import pytest
 
-from tests import Step
+from tests import GCC_FLAGS, Step
 
+ROOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+DEBUGGER_PATH = os.path.join(ROOT_PATH, "target", "debug", "dbg")
+FIXTURES_PATH = os.path.join(ROOT_PATH, "tests", "fixtures")
+GCC_PATH = shutil.which("gcc") or "gcc"
+CCACHE_PATH = shutil.which("ccache")
+# build dirs differ between runs, the debugger doesn't look at DW_AT_comp_dir anyway
+CCACHE_ENV = {**os.environ, "CCACHE_DIR": os.environ.get("CCACHE_DIR", os.path.join(ROOT_PATH, ".ccache")), "CCACHE_NOHASHDIR": "1"}
+SHM_PATH = "/dev/shm"
 
-@pytest.fixture(scope="session", autouse=True)
-def check_debugger():
-    assert os.path.exists("target/debug/dbg")
 
+def pytest_addoption(parser):
+    parser.addoption("--keep-artifacts", action="store_true", help="keep compiled test programs in pytest's default temp directory instead of /dev/shm (which is used only when mounted with exec)")
 
-@pytest.fixture
-def debugger(tmp_path_factory):
-    def _debugger(code: str, steps: list[Step], filename: str = ""):
-        tmp_path = tmp_path_factory.mktemp("source")
-        original_dir = os.getcwd()
-        if not filename:
-            filename = gen_random_filename()
+
+def pytest_configure(config):
+    if hasattr(config, "workerinput") or config.option.basetemp or config.getoption("keep_artifacts") or not os.path.isdir(SHM_PATH):
+        return
+    # docker mounts /dev/shm noexec, the debugger couldn't spawn programs built there
+    if os.statvfs(SHM_PATH).f_flag & os.ST_NOEXEC:
+        return
+
+    config.option.basetemp = tempfile.mkdtemp(prefix="pytest-dbg-", dir=SHM_PATH)
+    config.add_cleanup(lambda: shutil.rmtree(config.option.basetemp, ignore_errors=True))
+
+
+def pytest_sessionstart(session):
+    if hasattr(session.config, "workerinput"):
+        return
+
+    if not os.path.exists(DEBUGGER_PATH):
+        pytest.exit("debugger not found, run `cargo build` first", returncode=2)
+
+    sources_mtime = max(os.path.getmtime(os.path.join(root, name)) for root, _, names in os.walk(os.path.join(ROOT_PATH, "src")) for name in names)
+    if os.path.getmtime(DEBUGGER_PATH) < sources_mtime:
+        pytest.exit("debugger build is stale, run `cargo build` first", returncode=2)
+
+
+class CompileCache:
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.builds: dict[str, Future[str]] = {}
+        workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1))
+        self.executor = ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 1) // workers))
+
+    def __call__(self, code: str, filename: str, cflags: tuple[str, ...] = GCC_FLAGS) -> str:
+        return self.submit(code, filename, cflags).result()
+
+    def submit(self, code: str, filename: str, cflags: tuple[str, ...] = GCC_FLAGS) -> Future[str]:
+        code = normalize_code(code)
+        key = hashlib.sha256("|".join((code, filename, *cflags)).encode()).hexdigest()
+        if key not in self.builds:
+            self.builds[key] = self.executor.submit(self._build, os.path.join(self.cache_dir, key), code, filename, cflags)
+        return self.builds[key]
+
+    @staticmethod
+    def _build(build_dir: str, code: str, filename: str, cflags: tuple[str, ...]) -> str:
+        exec_path = os.path.join(build_dir, filename)
+
+        with open(build_dir + ".lock", 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            if not os.path.exists(exec_path):
+                CompileCache._compile(build_dir, code, filename, cflags)
+
+        return exec_path
+
+    @staticmethod
+    def _compile(build_dir: str, code: str, filename: str, cflags: tuple[str, ...]):
+        os.makedirs(build_dir, exist_ok=True)
         src_name = filename + ".c"
-        exec_name = filename
-        exec_path = os.path.join(tmp_path, exec_name)
 
-        try:
-            os.chdir(tmp_path)
+        with open(os.path.join(build_dir, src_name), 'w') as f:
+            f.write(code)
 
-            with open(src_name, 'w') as f:
-                f.write(code)
+        if CCACHE_PATH:
+            # ccache doesn't cache compile-and-link invocations, so compile and link separately
+            obj_name = filename + ".o"
+            commands = [[CCACHE_PATH, GCC_PATH, *cflags, "-c", src_name, "-o", obj_name], [GCC_PATH, obj_name, "-o", filename]]
+        else:
+            commands = [[GCC_PATH, *cflags, src_name, "-o", filename]]
 
-            # compile code
-            args = ["gcc", "-g", "-O0", "-Wall", src_name, "-o", exec_name]
-            subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, check=True, text=True)
+        try:
+            for args in commands:
+                subprocess.run(args, cwd=build_dir, env=CCACHE_ENV, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True, text=True)
         except subprocess.CalledProcessError as e:
-            pytest.fail(e.stdout)
-        finally:
-            os.chdir(original_dir)
-
-        # run debugger
-        with subprocess.Popen(["target/debug/dbg", exec_path], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True) as child:
-            for step in steps:
-                child.stdin.write(step.command + "\n")
-                child.stdin.flush()
-
-                if step.expected_output:
-                    if type(step.expected_output) is str:
-                        output = child.stdout.readline()
-                        assert step.expected_output in output, "expected '{}' in '{}'".format(step.expected_output, output)
-                        if step.not_expected_output:
-                            assert step.not_expected_output not in output, "not expected '{}' in '{}'".format(step.not_expected_output, output)
-                    else:
-                        for _ in step.expected_output:
-                            output = child.stdout.readline()
-                            assert any(expected in output for expected in step.expected_output), "{} not found in {}".format(output, step.expected_output)
-                            if step.not_expected_output:
-                                assert step.not_expected_output not in output, "not expected '{}' in '{}'".format(step.not_expected_output, output)
-
-            assert child.wait() == 0
+            pytest.fail(e.stderr)
+
+
+@pytest.fixture(scope="session")
+def compile_cache(request, tmp_path_factory):
+    root_dir = tmp_path_factory.getbasetemp()
+    if hasattr(request.config, "workerinput"):
+        root_dir = root_dir.parent
+    cache_dir = os.path.join(root_dir, "cc-cache")
+    os.makedirs(cache_dir, exist_ok=True)
+
+    cache = CompileCache(cache_dir)
+    yield cache
+    cache.executor.shutdown(cancel_futures=True)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def prefetch_programs(request, compile_cache):
+    for code, filename, cflags in find_programs(request.module):
+        compile_cache.submit(code, filename, cflags)
+
+
+@pytest.fixture(scope="session")
+def program_factory(compile_cache):
+    def _program_factory(name: str) -> str:
+        return compile_cache(read_fixture(name), name)
+
+    return _program_factory
+
+
+@pytest.fixture
+def run_debugger():
+    return _run_debugger
+
+
+@pytest.fixture
+def debugger(compile_cache):
+    def _debugger(code: str, steps: Sequence[Step], filename: str = "", cflags: tuple[str, ...] = GCC_FLAGS):
+        _run_debugger(compile_cache(code, filename or gen_filename(code), cflags), steps)
 
     return _debugger
 
 
-def gen_random_filename() -> str:
-    return ''.join(random.choice(string.ascii_lowercase) for _ in range(5))
+def _run_debugger(exec_path: str, steps: Sequence[Step]):
+    # stderr stays merged into stdout, the debugger reports errors there
+    with subprocess.Popen([DEBUGGER_PATH, exec_path], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, close_fds=False) as child:
+        stdout, _ = child.communicate("".join(step.command + "\n" for step in steps).encode())
+        lines = iter(stdout.split(b"\n"))
+
+        for step in steps:
+            step.match(lines)
+
+        assert child.returncode == 0
+
+
+def find_programs(module) -> Iterator[tuple[str, str, tuple[str, ...]]]:
+    def resolve(node):
+        if isinstance(node, ast.Name):
+            return getattr(module, node.id, None)
+        try:
+            return ast.literal_eval(node)
+        except ValueError:
+            return None
+
+    for node in ast.walk(ast.parse(inspect.getsource(module))):
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+            continue
+
+        if node.func.id == "debugger":
+            kwargs = {keyword.arg: resolve(keyword.value) for keyword in node.keywords}
+            code = kwargs.get("code")
+            if isinstance(code, str):
+                yield code, kwargs.get("filename") or gen_filename(code), kwargs.get("cflags") or GCC_FLAGS
+        elif node.func.id == "program_factory" and node.args and isinstance(name := resolve(node.args[0]), str):
+            yield read_fixture(name), name, GCC_FLAGS
+
+
+def read_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_PATH, name + ".c")) as f:
+        return f.read()
+
+
+def gen_filename(code: str) -> str:
+    return "t" + hashlib.sha256(normalize_code(code).encode()).hexdigest()[:8]
+
+
+def normalize_code(code: str) -> str:
+    # str.splitlines would also split on \f, \v and others, gcc doesn't
+    lines = code.replace("\r\n", "\n").removesuffix("\n").split("\n")
+    return "\n".join(line.rstrip(" \t\r") for line in lines) + "\n"
@@ -0,0 +1,8 @@
+#include <stdio.h>
+
+int main()
+{
+    int x = 0;
+    x = 1;
+    return 0;
+}
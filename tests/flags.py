@@ -0,0 +1,3 @@
+GCC_FLAGS = ("-g", "-O0", "-pipe")
+# line tables and functions only, for tests that never inspect variables
+MINIMAL_GCC_FLAGS = ("-g1", "-O0", "-pipe")
@@ -0,0 +1,58 @@
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+import sys
+
+
+@dataclass(frozen=True, slots=True)
+class Step:
+    command: str
+    expected_output: str | list[str] = ""
+    not_expected_output: str = ""
+    _matcher: Callable[["Step", Iterator[bytes]], None] = field(init=False, repr=False, compare=False)
+    _patterns: tuple[bytes, ...] = field(default=(), init=False, repr=False, compare=False)
+    _not_expected: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # the same few commands are repeated all over the suite
+        object.__setattr__(self, "command", sys.intern(self.command))
+        # output is matched as bytes, so encode expectations once here instead of on every match
+        object.__setattr__(self, "_not_expected", self.not_expected_output.encode())
+
+        if not self.expected_output:
+            matcher = _match_nothing
+        elif isinstance(self.expected_output, str):
+            matcher = _match_line
+            object.__setattr__(self, "_patterns", (self.expected_output.encode(),))
+        else:
+            matcher = _match_any_lines
+            # every output line is checked against every pattern, so check each one only once
+            object.__setattr__(self, "_patterns", tuple(dict.fromkeys(expected.encode() for expected in self.expected_output)))
+        object.__setattr__(self, "_matcher", matcher)
+
+    @classmethod
+    def exited(cls) -> "Step":
+        # the debugger prints nothing when the program exits, but session commands are rejected after that
+        return cls("stop", "invalid command")
+
+    def match(self, lines: Iterator[bytes]):
+        self._matcher(self, lines)
+
+
+# lines are raw debugger output, they are decoded only for error messages
+def _match_nothing(step: Step, lines: Iterator[bytes]):
+    pass
+
+
+def _match_line(step: Step, lines: Iterator[bytes]):
+    output = next(lines, b"")
+    assert step._patterns[0] in output, "expected '{}' in '{}'".format(step.expected_output, output.decode())
+    if step._not_expected:
+        assert step._not_expected not in output, "not expected '{}' in '{}'".format(step.not_expected_output, output.decode())
+
+
+def _match_any_lines(step: Step, lines: Iterator[bytes]):
+    for _ in step.expected_output:
+        output = next(lines, b"")
+        assert any(expected in output for expected in step._patterns), "{} not found in {}".format(output.decode(), step.expected_output)
+        if step._not_expected:
+            assert step._not_expected not in output, "not expected '{}' in '{}'".format(step.not_expected_output, output.decode())
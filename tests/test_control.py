@@ -1,53 +1,31 @@
 from tests import Step
 
 
-def test_run(debugger):
-    debugger(
-        code="""#include <stdio.h>
-
-int main()
-{
-    printf("hello world\\n");
-    return 0;
-}
-""",
+def test_run(program_factory, run_debugger):
+    run_debugger(
+        program_factory("hello"),
         steps=[
             Step("b 5", "breakpoint set"),
             Step("r"),
             Step("r", "invalid command"),
             Step("c", "hello world"),
             Step("r", "invalid command"),
-            Step("q"),
         ]
     )
 
 
-def test_quit_started_program(debugger):
-    debugger(
-        code="""#include <stdio.h>
-
-int main()
-{
-    printf("hello world\\n");
-    return 0;
-}
-""",
+def test_quit_started_program(program_factory, run_debugger):
+    run_debugger(
+        program_factory("hello"),
         steps=[
             Step("q"),
         ]
     )
 
 
-def test_quit_running_program(debugger):
-    debugger(
-        code="""#include <stdio.h>
-
-int main()
-{
-    printf("hello world\\n");
-    return 0;
-}
-""",
+def test_quit_running_program(program_factory, run_debugger):
+    run_debugger(
+        program_factory("hello"),
         steps=[
             Step("b 5", "breakpoint set"),
             Step("r"),
@@ -31,7 +31,6 @@ int main()
                 'const char* s = "hello world"'
             ]),
             Step("c"),
-            Step("q"),
         ]
     )
 
@@ -53,7 +52,6 @@ int main()
             Step("r"),
             Step("p p", "void* p = 0x"),
             Step("c"),
-            Step("q"),
         ]
     )
 
@@ -85,7 +83,6 @@ int main()
             Step("p foo.bar.b", "int b = 20"),
             Step("p foo", "Foo foo = { a = 10, bar = { b = 20 } }"),
             Step("c"),
-            Step("q"),
         ]
     )
 
@@ -144,7 +141,6 @@ int main()
             Step("p *root.left", "Node *left = { value = 5, left = null, right = null }"),
             Step("p root.right.right.value", "invalid path", "int value"),
             Step("c"),
-            Step("q"),
         ]
     )
 
@@ -167,7 +163,6 @@ int main()
             Step("r"),
             Step("p *foo", "Foo *foo = {}"),
             Step("c"),
-            Step("q"),
         ]
     )
 
@@ -186,7 +181,6 @@ def test_zero_len_vla(debugger):
             Step("r"),
             Step("p a", "int[] a = []"),
             Step("c"),
-            Step("q"),
         ]
     )
 
@@ -216,7 +210,6 @@ int main()
             Step("r"),
             Step("p foo.a", "int[] a = [...]"),
             Step("c"),
-            Step("q"),
         ]
     )
 
@@ -239,7 +232,6 @@ int main()
             Step("r"),
             Step("p flag", "volatile bool flag = false"),
             Step("c"),
-            Step("q"),
         ]
     )
 
@@ -261,6 +253,5 @@ int main()
             Step("r"),
             Step("p c", "_Atomic int c = 0"),
             Step("c"),
-            Step("q"),
         ]
     )
@@ -1,9 +1,6 @@
 from tests import Step
 
-
-def test_set_var(debugger):
-    debugger(
-        code="""#include <stdio.h>
+SET_VAR_CODE = """#include <stdio.h>
 #include <stdbool.h>
 
 int main()
@@ -16,32 +13,64 @@ int main()
     printf("i = %d, f = %.2f, b = %s, p = %p, s = %s\\n", i, f, b ? "true" : "false", p, s);
     return 0;
 }
-""",
-        steps=[
-            Step("b 10", "breakpoint set"),
-            Step("r"),
-            Step("set i 234"),
-            Step("p i", "int i = 234"),
-            Step("set f 9.81"),
-            Step("p f", "float f = 9.81"),
-            Step("set b false"),
-            Step("p b", "bool b = false"),
-            Step("set b true"),
-            Step("p b", "bool b = true"),
-            Step("set b 123", "invalid value"),
-            Step("set *p = 345"),
-            Step("p *p", "int *p = 345"),
-            Step("p i", "int i = 345"),
-            Step("set p = null"),
-            Step("p p", "int* p = null"),
-            Step("set x 123", "x not found"),
-            Step('set s = "somebody once told me the world is gonna roll me"'),
-            Step("p s", 'const char* s = "somebody once told me the world is gonna roll me"'),
-            Step("q"),
-        ]
+"""
+
+
+_STEPS_SET_VAR = (
+    Step("b 10", "breakpoint set"),
+    Step("r"),
+    Step("set i 234"),
+    Step("p i", "int i = 234"),
+    Step("set f 9.81"),
+    Step("p f", "float f = 9.81"),
+    Step("set b false"),
+    Step("p b", "bool b = false"),
+    Step("set b true"),
+    Step("p b", "bool b = true"),
+    Step("set *p = 345"),
+    Step("p *p", "int *p = 345"),
+    Step("p i", "int i = 345"),
+    Step("set p = null"),
+    Step("p p", "int* p = null"),
+    Step('set s = "somebody once told me the world is gonna roll me"'),
+    Step("p s", 'const char* s = "somebody once told me the world is gonna roll me"'),
+)
+
+
+def test_set_var(debugger):
+    debugger(
+        code=SET_VAR_CODE,
+        steps=_STEPS_SET_VAR
     )
 
 
+_STEPS_SET_VAR_ERRORS = (
+    Step("b 10", "breakpoint set"),
+    Step("r"),
+    Step("set b false"),
+    Step("set b 123", "invalid value"),
+    Step("set x 123", "x not found"),
+    Step("p b", "bool b = false"),
+)
+
+
+def test_set_var_errors(debugger):
+    debugger(
+        code=SET_VAR_CODE,
+        steps=_STEPS_SET_VAR_ERRORS
+    )
+
+
+_STEPS_SET_FIELD = (
+    Step("b 11", "breakpoint set"),
+    Step("r"),
+    Step("set foo.a 100"),
+    Step("p foo.a", "int a = 100"),
+    Step("set foo.b 0xcc"),
+    Step("p foo.b", "void* b = 0xcc"),
+)
+
+
 def test_set_field(debugger):
     debugger(
         code="""#include <stdio.h>
@@ -58,18 +87,24 @@ int main()
     return 0;
 }
 """,
-        steps=[
-            Step("b 11", "breakpoint set"),
-            Step("r"),
-            Step("set foo.a 100"),
-            Step("p foo.a", "int a = 100"),
-            Step("set foo.b 0xcc"),
-            Step("p foo.b", "void* b = 0xcc"),
-            Step("q"),
-        ]
+        steps=_STEPS_SET_FIELD
     )
 
 
+_STEPS_OPERATORS = (
+    Step("b 7", "breakpoint set"),
+    Step("r"),
+    Step("p &x", "int* &x = 0x"),
+    Step("p *&x", "int *&x = 10"),
+    Step("set *&x = 20"),
+    Step("p x", "int x = 20"),
+    Step("set &x = 30", "invalid location"),
+    Step("p x", "int x = 20"),
+    # Step("p **", "parser error"),
+    # Step("p &&x", "parser error"),
+)
+
+
 def test_operators(debugger):
     debugger(
         code="""#include <stdio.h>
@@ -82,22 +117,21 @@ int main()
     return 0;
 }
 """,
-        steps=[
-            Step("b 7", "breakpoint set"),
-            Step("r"),
-            Step("p &x", "int* &x = 0x"),
-            Step("p *&x", "int *&x = 10"),
-            Step("set *&x = 20"),
-            Step("p x", "int x = 20"),
-            Step("set &x = 30", "invalid location"),
-            Step("p x", "int x = 20"),
-            # Step("p **", "parser error"),
-            # Step("p &&x", "parser error"),
-            Step("q"),
-        ]
+        steps=_STEPS_OPERATORS
     )
 
 
+_STEPS_ENUM = (
+    Step("b 13", "breakpoint set"),
+    Step("r"),
+    Step("p color", "enum Color color = RED"),
+    Step("set color = BLUE"),
+    Step("p color", "enum Color color = BLUE"),
+    Step("set color = YELLOW", "invalid value"),
+    Step("c"),
+)
+
+
 def test_enum(debugger):
     debugger(
         code="""#include <stdio.h>
@@ -127,19 +161,23 @@ int main()
     return 0;
 }
 """,
-        steps=[
-            Step("b 13", "breakpoint set"),
-            Step("r"),
-            Step("p color", "enum Color color = RED"),
-            Step("set color = BLUE"),
-            Step("p color", "enum Color color = BLUE"),
-            Step("set color = YELLOW", "invalid value"),
-            Step("c"),
-            Step("q"),
-        ]
+        steps=_STEPS_ENUM
     )
 
 
+_STEPS_UNION = (
+    Step("b 13", "breakpoint set"),
+    Step("r"),
+    Step("p data", "invalid path"),
+    Step("p data.i", "int i = 10"),
+    Step("p data.s", "invalid path"),
+    Step("set data = 20", "invalid path"),
+    Step("set data.f = 3.14"),
+    Step("p data.f", "float f = 3.14"),
+    Step("c"),
+)
+
+
 def test_union(debugger):
     debugger(
         code="""#include <stdio.h>
@@ -158,21 +196,21 @@ int main()
     return 0;
 }
 """,
-        steps=[
-            Step("b 13", "breakpoint set"),
-            Step("r"),
-            Step("p data", "invalid path"),
-            Step("p data.i", "int i = 10"),
-            Step("p data.s", "invalid path"),
-            Step("set data = 20", "invalid path"),
-            Step("set data.f = 3.14"),
-            Step("p data.f", "float f = 3.14"),
-            Step("c"),
-            Step("q"),
-        ]
+        steps=_STEPS_UNION
     )
 
 
+_STEPS_ARRAY = (
+    Step("b 22", "breakpoint set"),
+    Step("r"),
+    Step("p a[1][1][1]", "int a[1][1][1] = 14"),
+    Step("p a[0]", "int[3][3] a[0] = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]"),
+    Step("set a[1][1][1] = 100"),
+    Step("p a[1][1]", "int[3] a[1][1] = [13, 100, 15]"),
+    Step("c"),
+)
+
+
 def test_array(debugger):
     debugger(
         code="""#include <stdio.h>
@@ -200,19 +238,19 @@ int main()
     return 0;
 }
 """,
-        steps=[
-            Step("b 22", "breakpoint set"),
-            Step("r"),
-            Step("p a[1][1][1]", "int a[1][1][1] = 14"),
-            Step("p a[0]", "int[3][3] a[0] = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]"),
-            Step("set a[1][1][1] = 100"),
-            Step("p a[1][1]", "int[3] a[1][1] = [13, 100, 15]"),
-            Step("c"),
-            Step("q"),
-        ]
+        steps=_STEPS_ARRAY
     )
 
 
+_STEPS_VLA = (
+    Step("b 7", "breakpoint set"),
+    Step("r"),
+    Step("set a[0] = 10"),
+    Step("p a", "int[] a = [10, "),
+    Step("c"),
+)
+
+
 def test_vla(debugger):
     debugger(
         code="""#include <stdio.h>
@@ -225,17 +263,21 @@ int main()
     return 0;
 }
 """,
-        steps=[
-            Step("b 7", "breakpoint set"),
-            Step("r"),
-            Step("set a[0] = 10"),
-            Step("p a", "int[] a = [10, "),
-            Step("c"),
-            Step("q"),
-        ]
+        steps=_STEPS_VLA
     )
 
 
+_STEPS_FUNC = (
+    Step("b 18", "breakpoint set"),
+    Step("r"),
+    Step("p op", "Operation op = add"),
+    Step("set op = sub"),
+    Step("p op", "Operation op = sub"),
+    Step("set op = mul", "invalid value"),
+    Step("c", "2"),
+)
+
+
 def test_func(debugger):
     debugger(
         code="""#include <stdio.h>
@@ -259,14 +301,5 @@ int main()
     return 0;
 }
 """,
-        steps=[
-            Step("b 18", "breakpoint set"),
-            Step("r"),
-            Step("p op", "Operation op = add"),
-            Step("set op = sub"),
-            Step("p op", "Operation op = sub"),
-            Step("set op = mul", "invalid value"),
-            Step("c", "2"),
-            Step("q"),
-        ]
+        steps=_STEPS_FUNC
     )
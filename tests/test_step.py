@@ -1,9 +1,6 @@
-from tests import Step
+from tests import MINIMAL_GCC_FLAGS, Step
 
-
-def test_step(debugger):
-    debugger(
-        code="""#include <stdio.h>
+CODE = """#include <stdio.h>
 
 int foo(int x) { return x * 2; }
 
@@ -18,57 +15,64 @@ int main()
     printf("%d\\n", y);
     return 0;
 }
-""",
-        steps=[
-            Step("b 7", "breakpoint set"),
-            Step("r"),
-            Step("loc", "t.c:7"),
-            Step("step"),
-            Step("loc", "t.c:13"),  # check that function call and prologue are skipped
-            Step("step"),
-            Step("loc", "t.c:14"),
-            Step("c"),
-            Step("q"),
-        ],
-        filename="t"
-    )
+"""
 
 
-def test_step_in(debugger):
+_STEPS_STEP = (
+    Step("b 7", "breakpoint set"),
+    Step("r"),
+    Step("loc", "t.c:7"),
+    Step("step"),
+    Step("loc", "t.c:13"),  # check that function call and prologue are skipped
+    Step("step"),
+    Step("loc", "t.c:14"),
+    Step("c"),
+)
+
+
+def test_step(debugger):
     debugger(
-        code="""#include <stdio.h>
+        code=CODE,
+        steps=_STEPS_STEP,
+        filename="t",
+        cflags=MINIMAL_GCC_FLAGS
+    )
 
-int foo(int x) { return x * 2; }
 
-int bar(int x)
-{
-    return foo(x);
-}
+_STEPS_STEP_IN = (
+    Step("b 12", "breakpoint set"),
+    Step("r"),
+    Step("loc", "t.c:12"),
+    Step("step-in"),
+    Step("loc", "t.c:7"),
+    Step("step-in"),
+    Step("loc", "t.c:3"),
+    Step("step-in"),
+    Step("loc", "t.c:13"),
+    Step("c"),
+)
 
-int main()
-{
-    int y = bar(5);
-    printf("%d\\n", y);
-    return 0;
-}
-""",
-        steps=[
-            Step("b 12", "breakpoint set"),
-            Step("r"),
-            Step("loc", "t.c:12"),
-            Step("step-in"),
-            Step("loc", "t.c:7"),
-            Step("step-in"),
-            Step("loc", "t.c:3"),
-            Step("step-in"),
-            Step("loc", "t.c:13"),
-            Step("c"),
-            Step("q"),
-        ],
-        filename="t"
+
+def test_step_in(debugger):
+    debugger(
+        code=CODE,
+        steps=_STEPS_STEP_IN,
+        filename="t",
+        cflags=MINIMAL_GCC_FLAGS
     )
 
 
+_STEPS_STEP_OUT = (
+    Step("b 5", "breakpoint set"),
+    Step("r"),
+    Step("loc", "t.c:5"),
+    Step("step-out"),
+    Step("loc", "t.c:11"),
+    Step("step-out", "10"),
+    Step.exited(),
+)
+
+
 def test_step_out(debugger):
     debugger(
         code="""#include <stdio.h>
@@ -85,15 +89,7 @@ int main()
     return 0;
 }
 """,
-        steps=[
-            Step("b 5", "breakpoint set"),
-            Step("r"),
-            Step("loc", "t.c:5"),
-            Step("step-out"),
-            Step("loc", "t.c:11"),
-            Step("step-out", "10"),
-            Step("stop", "invalid command"),  # assert program completed
-            Step("q"),
-        ],
-        filename="t"
+        steps=_STEPS_STEP_OUT,
+        filename="t",
+        cflags=MINIMAL_GCC_FLAGS
     )